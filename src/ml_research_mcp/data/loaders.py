@@ -1,18 +1,230 @@
 """Data loaders for various file formats using Polars.
 
-This module provides functions to load data from CSV, JSON files,
-or direct dictionary input into Polars DataFrames.
+This module provides functions to load data from CSV, JSON/NDJSON,
+or Parquet files, or direct dictionary input, into Polars DataFrames.
 """
 
+import re
+from collections.abc import Callable
 from pathlib import Path
 from typing import overload
 
+import numpy as np
 import polars as pl
 
+# Newline-delimited JSON: an object end followed by an object start on
+# the next line (possibly with trailing/leading whitespace)
+_NDJSON_PATTERN = re.compile(rb"\}\s*\n\s*\{")
+
+# Cache of parsed DataFrames keyed by (resolved path, mtime_ns, size,
+# column projection). MCP sessions commonly replay the same file_path
+# across tool calls; caching turns repeat loads into a dict lookup. The
+# mtime/size key invalidates entries automatically when the file
+# changes on disk. Eviction is LRU: hits are moved to the end of the
+# (insertion-ordered) dict and the front entry is the least recently
+# used.
+_FILE_CACHE: dict[tuple[Path, int, int, tuple[str, ...] | None], pl.DataFrame] = {}
+_FILE_CACHE_MAX_ENTRIES = 32
+
+# CSV files above this size are read through pyarrow's multithreaded
+# block reader (when pyarrow is installed) instead of being parsed into
+# RAM in one shot
+_LARGE_CSV_BYTES = 256 * 1024 * 1024
+
+
+def _cached_read(
+    path: Path,
+    reader: Callable[[], pl.DataFrame],
+    columns: tuple[str, ...] | None = None,
+) -> pl.DataFrame:
+    """Read a file through the module-level DataFrame cache.
+
+    Args:
+        path: Resolved path to the file
+        reader: Zero-argument callable performing the actual read
+        columns: Column projection the reader applies, part of the cache key
+
+    Returns:
+        Polars DataFrame (cloned, so callers can't mutate the cached copy)
+    """
+    stat = path.stat()
+    key = (path, stat.st_mtime_ns, stat.st_size, columns)
+
+    cached = _FILE_CACHE.pop(key, None)
+    if cached is None:
+        # Evict least recently used entries to bound memory
+        while len(_FILE_CACHE) >= _FILE_CACHE_MAX_ENTRIES:
+            _FILE_CACHE.pop(next(iter(_FILE_CACHE)))
+        cached = reader()
+
+    # Re-inserting moves the entry to the most-recently-used position
+    _FILE_CACHE[key] = cached
+
+    # clone() is a cheap copy-on-write operation in Polars
+    return cached.clone()
+
+
+def _read_csv_full(path: Path) -> pl.DataFrame:
+    """Read an entire CSV file into a DataFrame.
+
+    Files larger than _LARGE_CSV_BYTES are parsed with pyarrow's
+    block-based multithreaded CSV reader and handed to Polars zero-copy
+    via the Arrow table, avoiding the peak-memory spike of a single-shot
+    parse. pyarrow is an optional dependency; without it (or for small
+    files) this falls back to pl.read_csv.
+
+    Args:
+        path: Resolved path to the CSV file
+
+    Returns:
+        Polars DataFrame containing the full file
+    """
+    if path.stat().st_size > _LARGE_CSV_BYTES:
+        try:
+            # ruff: noqa: PLC0415 - optional dependency, imported lazily
+            import pyarrow.csv as pa_csv
+        except ImportError:
+            pass
+        else:
+            table = pa_csv.read_csv(
+                path,
+                read_options=pa_csv.ReadOptions(use_threads=True, block_size=1 << 23),
+            )
+            df = pl.from_arrow(table)
+            assert isinstance(df, pl.DataFrame)  # Type guard for ty
+            return df
+
+    return pl.read_csv(path)
+
+
+def _is_ndjson(path: Path) -> bool:
+    """Detect newline-delimited JSON by sniffing the head of the file.
+
+    A regular JSON file holds a single document (object or array);
+    NDJSON holds one object per line. Reading the first 512 bytes is
+    enough to tell them apart without parsing the whole file.
+
+    Args:
+        path: Resolved path to the file
+
+    Returns:
+        True if the file looks like NDJSON, False otherwise
+    """
+    with path.open("rb") as f:
+        head = f.read(512)
+
+    if not head.lstrip().startswith(b"{"):
+        return False
+
+    return _NDJSON_PATTERN.search(head) is not None
+
+
+def _missing_column_error(
+    scan: pl.LazyFrame, projection: tuple[str, ...]
+) -> ValueError:
+    """Build the standard missing-column ValueError for a failed projection.
+
+    Mirrors the message extract_column raises for eagerly loaded frames,
+    so callers see the same error shape whether the column check happens
+    in the scan or after the full read.
+
+    Args:
+        scan: Unprojected lazy scan of the file, used to list columns
+        projection: Column names the failed projection requested
+
+    Returns:
+        ValueError naming the missing column and the available ones
+    """
+    available = scan.collect_schema().names()
+    missing = next((c for c in projection if c not in available), projection[0])
+    msg = f"Column '{missing}' not found in data. Available columns: {', '.join(available)}"
+    return ValueError(msg)
+
+
+def _load_csv(path: Path, columns: list[str] | None) -> pl.DataFrame:
+    """Load a CSV file, pushing any column projection into the scan."""
+    if columns:
+        # Push the projection into the scan so only the requested
+        # columns are parsed
+        projection = tuple(columns)
+        scan = pl.scan_csv(path)
+        try:
+            return _cached_read(
+                path,
+                lambda: scan.select(projection).collect(),
+                columns=projection,
+            )
+        except pl.exceptions.ColumnNotFoundError as e:
+            raise _missing_column_error(scan, projection) from e
+    return _cached_read(path, lambda: _read_csv_full(path))
+
+
+def _load_json(path: Path, columns: list[str] | None) -> pl.DataFrame:  # noqa: ARG001
+    """Load a JSON or NDJSON file, sniffing .json files for NDJSON content."""
+    if path.suffix.lower() != ".json" or _is_ndjson(path):
+        # Stream NDJSON line-by-line instead of buffering the
+        # whole file; keeps peak memory bounded for large logs
+        return _cached_read(
+            path,
+            lambda: pl.scan_ndjson(path).collect(engine="streaming"),
+        )
+    return _cached_read(path, lambda: pl.read_json(path))
+
+
+def _load_parquet(path: Path, columns: list[str] | None) -> pl.DataFrame:
+    """Load a Parquet file, reading only the projected column chunks."""
+    # Parquet is columnar: scan + streaming collect reads
+    # (and decompresses) only the touched column chunks
+    scan = pl.scan_parquet(path)
+    projection = tuple(columns) if columns else None
+    lf = scan.select(projection) if projection else scan
+    try:
+        return _cached_read(
+            path,
+            lambda: lf.collect(engine="streaming"),
+            columns=projection,
+        )
+    except pl.exceptions.ColumnNotFoundError as e:
+        if projection is None:
+            raise
+        raise _missing_column_error(scan, projection) from e
+
+
+def _load_ipc(path: Path, columns: list[str] | None) -> pl.DataFrame:
+    """Load an Arrow IPC/Feather file, projecting columns in the scan."""
+    scan = pl.scan_ipc(path)
+    projection = tuple(columns) if columns else None
+    lf = scan.select(projection) if projection else scan
+    try:
+        return _cached_read(
+            path,
+            lf.collect,
+            columns=projection,
+        )
+    except pl.exceptions.ColumnNotFoundError as e:
+        if projection is None:
+            raise
+        raise _missing_column_error(scan, projection) from e
+
+
+# Dispatch table mapping file suffix to (format label, loader). The
+# label appears in error messages; loaders take (path, columns).
+_LOADERS: dict[str, tuple[str, Callable[[Path, list[str] | None], pl.DataFrame]]] = {
+    ".csv": ("CSV", _load_csv),
+    ".json": ("JSON", _load_json),
+    ".ndjson": ("JSON", _load_json),
+    ".jsonl": ("JSON", _load_json),
+    ".parquet": ("Parquet", _load_parquet),
+    ".feather": ("IPC", _load_ipc),
+    ".arrow": ("IPC", _load_ipc),
+    ".ipc": ("IPC", _load_ipc),
+}
+
 
 def load_data(
     file_path: str | None = None,
     data: dict | None = None,
+    columns: list[str] | None = None,
 ) -> pl.DataFrame:
     """Load data from file or direct input into a Polars DataFrame.
 
@@ -21,6 +233,9 @@ def load_data(
     Args:
         file_path: Path to CSV, JSON, or other supported file format
         data: Direct data as dictionary (column_name -> values)
+        columns: Optional column projection. For CSV, Parquet, and Arrow
+            IPC files the projection is pushed into the scan so only the
+            requested columns are read; other inputs are loaded in full.
 
     Returns:
         Polars DataFrame containing the loaded data
@@ -67,37 +282,34 @@ def load_data(
             )
             raise FileNotFoundError(msg)
 
-        # Determine file type and load accordingly
+        # Determine file type and dispatch to the matching loader
         suffix = path.suffix.lower()
+        loader_entry = _LOADERS.get(suffix)
 
-        if suffix == ".csv":
-            try:
-                return pl.read_csv(path)
-            except Exception as e:
-                msg = (
-                    f"Failed to read CSV file '{file_path}': {e}. "
-                    "Please ensure the file is a valid CSV format."
-                )
-                raise ValueError(msg) from e
-
-        elif suffix == ".json":
-            try:
-                return pl.read_json(path)
-            except Exception as e:
-                msg = (
-                    f"Failed to read JSON file '{file_path}': {e}. "
-                    "Please ensure the file is a valid JSON format."
-                )
-                raise ValueError(msg) from e
-
-        else:
+        if loader_entry is None:
+            supported = ", ".join(_LOADERS)
             msg = (
                 f"Unsupported file format: {suffix}. "
-                f"Supported formats are: .csv, .json. "
+                f"Supported formats are: {supported}. "
                 f"File: {file_path}"
             )
             raise ValueError(msg)
 
+        label, loader = loader_entry
+        try:
+            return loader(path, columns)
+        except ValueError:
+            # Loaders raise ValueError only with user-facing messages
+            # (e.g. a missing projected column); pass those through
+            # instead of wrapping them in the generic read error
+            raise
+        except Exception as e:
+            msg = (
+                f"Failed to read {label} file '{file_path}': {e}. "
+                f"Please ensure the file is a valid {label} format."
+            )
+            raise ValueError(msg) from e
+
     # Load from direct data
     try:
         return pl.DataFrame(data)
@@ -110,6 +322,51 @@ def load_data(
         raise ValueError(msg) from e
 
 
+def load_and_extract(
+    file_path: str | None = None,
+    data: dict | None = None,
+    columns: list[str] | None = None,
+) -> dict[str, np.ndarray]:
+    """Load data and extract the given columns as numpy arrays.
+
+    Combines load_data and extract_column for the common tool pattern
+    of plotting a handful of named columns: the projection is pushed
+    into the file scan, and each column comes back as a typed array
+    ready for matplotlib, without an intermediate DataFrame in the
+    caller.
+
+    Args:
+        file_path: Path to a supported data file
+        data: Direct data as dictionary (column_name -> values)
+        columns: Names of the columns to extract
+
+    Returns:
+        Dict mapping each requested column name to a numpy array
+
+    Raises:
+        ValueError: If a requested column doesn't exist in the data
+            (plus everything load_data raises)
+
+    Examples:
+        >>> arrays = load_and_extract(file_path="run.csv", columns=["step", "loss"])
+        >>> arrays["loss"].dtype
+        dtype('float64')
+    """
+    columns = columns or []
+    # Deduplicate while preserving order; plotting the same column on
+    # both axes is legal and must not break the projection
+    wanted = list(dict.fromkeys(columns))
+
+    df = load_data(file_path=file_path, data=data, columns=wanted or None)
+
+    arrays = {}
+    for name in wanted:
+        series = extract_column(df, name)
+        assert isinstance(series, pl.Series)  # Type guard for ty
+        arrays[name] = series.to_numpy()
+    return arrays
+
+
 @overload
 def extract_column(df: pl.DataFrame, column: str) -> pl.Series: ...
 
@@ -146,11 +403,15 @@ def extract_column(
         [1, 2, 3]
     """
     if isinstance(column, str):
-        if column not in df.columns:
+        # get_column skips the membership pre-check and __getitem__
+        # dispatch on the hot path; missing columns surface as the same
+        # ValueError as before
+        try:
+            return df.get_column(column)
+        except pl.exceptions.ColumnNotFoundError as e:
             available = ", ".join(df.columns)
             msg = f"Column '{column}' not found in data. Available columns: {available}"
-            raise ValueError(msg)
-        return df[column]
+            raise ValueError(msg) from e
 
     # If it's already a list, return as-is
     return column
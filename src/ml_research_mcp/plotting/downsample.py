@@ -0,0 +1,80 @@
+"""Downsampling of dense series for plotting.
+
+This module implements Largest-Triangle-Three-Buckets (LTTB), a
+downsampling algorithm that preserves the visual shape of a line —
+peaks, troughs, and trend changes — far better than uniform striding.
+It is used before plotting when a series holds many more points than
+the output has pixel columns to show them.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def lttb_downsample(
+    x: np.ndarray,
+    y: np.ndarray,
+    n_out: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Downsample a series to n_out points with LTTB.
+
+    The series is split into n_out - 2 buckets between the (always kept)
+    first and last points. From each bucket the point forming the
+    largest triangle with the previously selected point and the next
+    bucket's average is kept, which preserves visually significant
+    extremes.
+
+    Args:
+        x: X values, ordered, shape (n,)
+        y: Y values, shape (n,)
+        n_out: Number of points to keep (at least 3)
+
+    Returns:
+        Tuple of (x, y) arrays of length n_out. If the input already
+        has n_out points or fewer, the inputs are returned unchanged.
+
+    Examples:
+        >>> x = np.arange(100_000, dtype=np.float64)
+        >>> y = np.sin(x / 500.0)
+        >>> xs, ys = lttb_downsample(x, y, 2000)
+        >>> len(xs)
+        2000
+    """
+    n = len(x)
+    if n_out >= n or n < 3:
+        return x, y
+    if n_out < 3:
+        msg = f"n_out must be at least 3, got {n_out}"
+        raise ValueError(msg)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    # Bucket boundaries: first and last points sit in their own buckets
+    bounds = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+
+    indices = np.empty(n_out, dtype=np.intp)
+    indices[0] = 0
+    indices[-1] = n - 1
+
+    prev = 0
+    for i in range(n_out - 2):
+        lo, hi = bounds[i], bounds[i + 1]
+
+        # Average of the next bucket (the final "bucket" is the last point)
+        next_lo, next_hi = bounds[i + 1], bounds[i + 2] if i + 2 < n_out - 1 else n
+        avg_x = x[next_lo:next_hi].mean()
+        avg_y = y[next_lo:next_hi].mean()
+
+        # Triangle areas against the previous kept point, vectorized
+        # over the bucket: |(x_prev - avg_x)(y_j - y_prev) -
+        # (x_prev - x_j)(avg_y - y_prev)| / 2
+        areas = np.abs(
+            (x[prev] - avg_x) * (y[lo:hi] - y[prev])
+            - (x[prev] - x[lo:hi]) * (avg_y - y[prev])
+        )
+        prev = lo + int(np.argmax(areas))
+        indices[i + 1] = prev
+
+    return x[indices], y[indices]
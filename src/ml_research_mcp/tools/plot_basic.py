@@ -4,16 +4,48 @@ This module provides fundamental plotting capabilities for
 time series data, scatter relationships, and categorical comparisons.
 """
 
-from typing import Literal
+import math
+from typing import Literal, overload
 
+import numpy as np
 from PIL import Image
 
-from ml_research_mcp.data.loaders import extract_column, load_data
-from ml_research_mcp.plotting.core import create_plot_figure, save_plot_to_image
+from ml_research_mcp.data.loaders import extract_column, load_and_extract, load_data
+from ml_research_mcp.plotting.core import (
+    RASTERIZE_MIN_POINTS,
+    create_plot_figure,
+    save_plot_to_image,
+)
+from ml_research_mcp.plotting.downsample import lttb_downsample
 from ml_research_mcp.plotting.formatters import apply_style, get_colormap_name
 from ml_research_mcp.server import mcp
 
 
+@overload
+def _to_array(values: list | tuple) -> np.ndarray | list | tuple: ...
+
+
+@overload
+def _to_array[T](values: T) -> T: ...
+
+
+def _to_array(values: object) -> object:
+    """Convert a sequence of numbers to a contiguous float64 array.
+
+    Matplotlib iterates Python sequences element by element; handing it
+    a typed array instead makes that a single C-level copy, and
+    contiguity lets downstream transforms work on the buffer directly.
+    Non-sequence input (column names, scalars) and non-numeric
+    sequences (e.g. bar category labels) are returned unchanged.
+    """
+    if not isinstance(values, (list, tuple)):
+        return values
+    try:
+        return np.ascontiguousarray(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        return values
+
+
 @mcp.tool()
 def plot_line(
     x: str | list[float],
@@ -60,26 +92,51 @@ def plot_line(
     style = style or {}
     output = output or {}
 
-    # Load data if needed
-    df = None
-    if data_input:
-        df = load_data(**data_input)
-
     # Extract x and y data
-    if df is not None:
+    if data_input and isinstance(x, str) and isinstance(y, str):
+        # Project the scan down to the plotted columns and get typed
+        # arrays back in one step
+        arrays = load_and_extract(**data_input, columns=[x, y])
+        x_data = arrays[x]
+        y_data = arrays[y]
+    elif data_input:
+        df = load_data(**data_input)
         x_data = extract_column(df, x)
         y_data = extract_column(df, y)
     else:
-        x_data = x
-        y_data = y
+        x_data = _to_array(x)
+        y_data = _to_array(y)
 
-    # Create figure
     width = output.get("width", 15.0)
     height = output.get("height", 10.0)
+    dpi = output.get("dpi", 300)
+
+    # Series holding far more points than the output has pixel columns
+    # are downsampled with LTTB, which keeps peaks and trend changes
+    # that uniform striding would miss. Non-numeric data (e.g. string
+    # categories) is left untouched.
+    pixel_columns = int(width / 2.54 * dpi)
+    if len(x_data) > 4 * pixel_columns:
+        try:
+            x_arr = np.asarray(x_data, dtype=np.float64)
+            y_arr = np.asarray(y_data, dtype=np.float64)
+        except (TypeError, ValueError):
+            pass
+        else:
+            x_data, y_data = lttb_downsample(x_arr, y_arr, 2 * pixel_columns)
+
+    # Create figure
     fig, ax = create_plot_figure(width_cm=width, height_cm=height)
 
     # Plot data
-    ax.plot(x_data, y_data, linewidth=2)
+    lines = ax.plot(x_data, y_data, linewidth=2)
+
+    # For dense vector output, rasterize the data layer only; axes,
+    # labels, and grid stay vectorized
+    format_type = output.get("format", "png")
+    if format_type in ("pdf", "svg") and len(x_data) >= RASTERIZE_MIN_POINTS:
+        for line in lines:
+            line.set_rasterized(True)
 
     # Apply style
     apply_style(
@@ -87,13 +144,11 @@ def plot_line(
         title=style.get("title"),
         xlabel=style.get("xlabel"),
         ylabel=style.get("ylabel"),
-        grid=style.get("grid", True),
+        grid=style.get("grid"),
         colormap=style.get("colormap"),
     )
 
     # Save and return
-    format_type = output.get("format", "png")
-    dpi = output.get("dpi", 300)
     return save_plot_to_image(fig, fmt=format_type, dpi=dpi)
 
 
@@ -142,13 +197,19 @@ def plot_scatter(
     style = style or {}
     output = output or {}
 
-    # Load data if needed
-    df = None
-    if data_input:
-        df = load_data(**data_input)
-
     # Extract data
-    if df is not None:
+    if data_input and isinstance(x, str) and isinstance(y, str):
+        # Project the scan down to the plotted columns (including size
+        # and color when given as column names) and get typed arrays
+        # back in one step
+        wanted = [c for c in (x, y, size, color) if isinstance(c, str)]
+        arrays = load_and_extract(**data_input, columns=wanted)
+        x_data = arrays[x]
+        y_data = arrays[y]
+        size_data = arrays[size] if isinstance(size, str) else size
+        color_data = arrays[color] if isinstance(color, str) else color
+    elif data_input:
+        df = load_data(**data_input)
         x_data = extract_column(df, x)
         y_data = extract_column(df, y)
         # For size and color, handle both column names and direct values
@@ -157,27 +218,78 @@ def plot_scatter(
             extract_column(df, color) if color and isinstance(color, str) else color
         )
     else:
-        x_data = x
-        y_data = y
-        size_data = size
-        color_data = color
+        x_data = _to_array(x)
+        y_data = _to_array(y)
+        size_data = _to_array(size)
+        color_data = _to_array(color)
 
     # Create figure
     width = output.get("width", 15.0)
     height = output.get("height", 10.0)
     fig, ax = create_plot_figure(width_cm=width, height_cm=height)
 
-    # Plot data
-    scatter_kwargs = {}
-
-    if size_data is not None:
-        scatter_kwargs["s"] = size_data
-
-    if color_data is not None:
-        scatter_kwargs["c"] = color_data
-        scatter_kwargs["cmap"] = get_colormap_name(style.get("colormap"))
-
-    ax.scatter(x_data, y_data, **scatter_kwargs)
+    # Plot data. When every marker shares one size and color, a Line2D
+    # with markers renders the marker path once and stamps it, instead
+    # of scatter's per-point PathCollection transform; this is several
+    # times faster on large point clouds and draws identically.
+    uniform = color_data is None and (
+        size_data is None or isinstance(size_data, (int, float))
+    )
+    if uniform:
+        # scatter sizes are marker areas in points^2; Line2D takes the
+        # marker diameter in points
+        markersize = (
+            math.sqrt(size_data) if isinstance(size_data, (int, float)) else None
+        )
+        points = ax.plot(
+            x_data,
+            y_data,
+            marker="o",
+            linestyle="None",
+            markersize=markersize,
+        )[0]
+    else:
+        # When every channel is a per-point numeric array, pack x, y,
+        # size, and color into one (n, 4) float32 block and pass column
+        # views: float32 halves the bytes moved through scatter's
+        # normalize/transform steps and the single contiguous block
+        # stays cache-resident. Non-numeric color values (e.g. color
+        # name lists) fall back to the plain call.
+        pts = None
+        if size_data is not None and not isinstance(size_data, (int, float)):
+            try:
+                pts = np.empty((len(x_data), 4), dtype=np.float32)
+                pts[:, 0] = x_data
+                pts[:, 1] = y_data
+                pts[:, 2] = size_data
+                pts[:, 3] = color_data
+            except (TypeError, ValueError):
+                pts = None
+
+        if pts is not None:
+            points = ax.scatter(
+                pts[:, 0],
+                pts[:, 1],
+                s=pts[:, 2],
+                c=pts[:, 3],
+                cmap=get_colormap_name(style.get("colormap")),
+            )
+        else:
+            scatter_kwargs = {}
+
+            if size_data is not None:
+                scatter_kwargs["s"] = size_data
+
+            if color_data is not None:
+                scatter_kwargs["c"] = color_data
+                scatter_kwargs["cmap"] = get_colormap_name(style.get("colormap"))
+
+            points = ax.scatter(x_data, y_data, **scatter_kwargs)
+
+    # For dense vector output, rasterize the data layer only
+    format_type = output.get("format", "png")
+    if format_type in ("pdf", "svg") and len(x_data) >= RASTERIZE_MIN_POINTS:
+        points.set_rasterized(True)
 
     # Apply style
     apply_style(
@@ -185,12 +297,11 @@ def plot_scatter(
         title=style.get("title"),
         xlabel=style.get("xlabel"),
         ylabel=style.get("ylabel"),
-        grid=style.get("grid", True),
+        grid=style.get("grid"),
         colormap=style.get("colormap"),
     )
 
     # Save and return
-    format_type = output.get("format", "png")
     dpi = output.get("dpi", 300)
     return save_plot_to_image(fig, fmt=format_type, dpi=dpi)
 
@@ -250,8 +361,8 @@ def plot_bar(
         x_data = extract_column(df, x)
         y_data = extract_column(df, y)
     else:
-        x_data = x
-        y_data = y
+        x_data = _to_array(x)
+        y_data = _to_array(y)
 
     # Create figure
     width = output.get("width", 15.0)
@@ -260,9 +371,15 @@ def plot_bar(
 
     # Plot data
     if orientation == "horizontal":
-        ax.barh(x_data, y_data)
+        bars = ax.barh(x_data, y_data)
     else:
-        ax.bar(x_data, y_data)
+        bars = ax.bar(x_data, y_data)
+
+    # For dense vector output, rasterize the data layer only
+    format_type = output.get("format", "png")
+    if format_type in ("pdf", "svg") and len(x_data) >= RASTERIZE_MIN_POINTS:
+        for bar in bars:
+            bar.set_rasterized(True)
 
     # Apply style
     apply_style(
@@ -270,11 +387,10 @@ def plot_bar(
         title=style.get("title"),
         xlabel=style.get("xlabel"),
         ylabel=style.get("ylabel"),
-        grid=style.get("grid", True),
+        grid=style.get("grid"),
         colormap=style.get("colormap"),
     )
 
     # Save and return
-    format_type = output.get("format", "png")
     dpi = output.get("dpi", 300)
     return save_plot_to_image(fig, fmt=format_type, dpi=dpi)
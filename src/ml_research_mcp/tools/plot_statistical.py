@@ -4,14 +4,64 @@ This module provides statistical visualization capabilities for
 data distribution analysis and comparison.
 """
 
+from typing import TYPE_CHECKING
+
+import numpy as np
 import polars as pl
 from PIL import Image
 
+if TYPE_CHECKING:
+    import matplotlib.axes
+
 from ml_research_mcp.data.loaders import extract_column, load_data
-from ml_research_mcp.plotting.core import create_plot_figure, save_plot_to_image
+from ml_research_mcp.plotting.core import (
+    RASTERIZE_MIN_POINTS,
+    create_plot_figure,
+    save_plot_to_image,
+)
 from ml_research_mcp.plotting.formatters import apply_style
 from ml_research_mcp.server import mcp
 
+# Datasets with at least this many points take the binned-density
+# violin path instead of matplotlib's exact KDE, whose cost grows with
+# the sample size times the evaluation grid
+_FAST_VIOLIN_MIN_POINTS = 10_000
+
+
+def _fast_violin(
+    ax: "matplotlib.axes.Axes",
+    data_values: list[np.ndarray],
+    positions: list[int],
+) -> None:
+    """Draw approximate violins from binned densities.
+
+    matplotlib's violinplot evaluates a gaussian KDE over every sample,
+    which is quadratic-ish in practice and dominates render time for
+    large datasets. Binning into a histogram and smoothing the bin
+    counts with a small gaussian kernel gives a visually equivalent
+    outline at this sample size in linear time. Means and medians are
+    drawn as short horizontal lines, matching the default violinplot
+    decorations.
+    """
+    # Gaussian smoothing kernel over +/- 4 bins
+    kernel = np.exp(-0.5 * (np.arange(-4, 5) / 2.0) ** 2)
+    kernel /= kernel.sum()
+
+    for pos, values in zip(positions, data_values, strict=True):
+        counts, edges = np.histogram(values, bins=128, density=True)
+        centers = (edges[:-1] + edges[1:]) / 2.0
+        density = np.convolve(counts, kernel, mode="same")
+
+        peak = density.max()
+        half_width = 0.4 * density / peak if peak > 0 else density
+        ax.fill_betweenx(
+            centers, pos - half_width, pos + half_width, alpha=0.5, rasterized=True
+        )
+
+        mean = float(values.mean())
+        median = float(np.median(values))
+        ax.hlines([mean, median], pos - 0.2, pos + 0.2, colors=["C1", "C2"])
+
 
 @mcp.tool()
 def plot_histogram(
@@ -68,8 +118,31 @@ def plot_histogram(
     height = output.get("height", 10.0)
     fig, ax = create_plot_figure(width_cm=width, height_cm=height)
 
-    # Plot histogram
-    ax.hist(data_values, bins=bins, density=density, alpha=0.7, edgecolor="black")
+    # Bin in numpy and draw the result as one bar call. ax.hist builds
+    # a Rectangle patch per bin on top of re-binning internally; for
+    # large inputs the C-level np.histogram plus a single BarContainer
+    # is noticeably cheaper and renders identically.
+    arr = np.asarray(data_values, dtype=np.float64)
+    counts, edges = np.histogram(arr, bins=bins, density=density)
+    # absolute_width keeps the widths in data units: UltraPlot's bar
+    # otherwise treats width as a fraction of the x-step, which would
+    # shrink (or overlap) the bins
+    patches = ax.bar(
+        edges[:-1],
+        counts,
+        width=np.diff(edges),
+        align="edge",
+        alpha=0.7,
+        edgecolor="black",
+        absolute_width=True,
+    )
+
+    # For dense vector output, rasterize the data layer only; axes,
+    # labels, and grid stay vectorized
+    format_type = output.get("format", "png")
+    if format_type in ("pdf", "svg") and len(arr) >= RASTERIZE_MIN_POINTS:
+        for patch in patches:
+            patch.set_rasterized(True)
 
     # Apply style
     ylabel = "Density" if density else "Frequency"
@@ -78,12 +151,11 @@ def plot_histogram(
         title=style.get("title"),
         xlabel=style.get("xlabel"),
         ylabel=style.get("ylabel", ylabel),
-        grid=style.get("grid", True),
+        grid=style.get("grid"),
         colormap=style.get("colormap"),
     )
 
     # Save and return
-    format_type = output.get("format", "png")
     dpi = output.get("dpi", 300)
     return save_plot_to_image(fig, fmt=format_type, dpi=dpi)
 
@@ -138,35 +210,51 @@ def plot_box(
     # Extract data
     if df is not None:
         if isinstance(data, str):
-            # Single column
+            # Single column; to_numpy reuses the Arrow buffer without
+            # boxing every value into a Python float like to_list did
             series = extract_column(df, data)
             assert isinstance(series, pl.Series)  # Type guard for ty
-            data_values = [series.to_list()]
+            data_values = [series.to_numpy()]
         else:
-            # Multiple columns
-            data_values = []
-            for col in data:
-                series = extract_column(df, col)
-                assert isinstance(series, pl.Series)  # Type guard for ty
-                data_values.append(series.to_list())
+            # Multiple columns in one vectorized conversion: select
+            # produces a single (n, k) array instead of k per-column
+            # Series-to-array round trips
+            try:
+                arr = df.select(data).to_numpy()
+            except pl.exceptions.ColumnNotFoundError as e:
+                available = ", ".join(df.columns)
+                msg = f"Column not found in data. Available columns: {available}"
+                raise ValueError(msg) from e
+            data_values = [arr[:, i] for i in range(arr.shape[1])]
     elif isinstance(data[0], list):
-        # Direct data - multiple datasets
-        data_values = data
+        # Direct data - multiple datasets, converted once to typed arrays
+        data_values = [np.asarray(d, dtype=np.float64) for d in data]
     else:
         # Direct data - single list
-        data_values = [data]
+        data_values = [np.asarray(data, dtype=np.float64)]
 
     # Create figure
     width = output.get("width", 15.0)
     height = output.get("height", 10.0)
     fig, ax = create_plot_figure(width_cm=width, height_cm=height)
 
-    # Plot box plot
-    ax.boxplot(data_values)
+    # Draw through UltraPlot's positional (x, data) convention so the
+    # boxes land on the tick positions 1..k; the positions kwarg is
+    # dropped by UltraPlot's input standardization, which would leave
+    # the bodies at 0..k-1 and every label one box off. Equal-length
+    # datasets go in as one (n, k) array so the per-dataset statistics
+    # run in a single vectorized pass; ragged datasets are drawn one
+    # column at a time (NaN padding would corrupt the quartiles).
+    n_datasets = len(data_values)
+    positions = list(range(1, n_datasets + 1))
+    if len({len(v) for v in data_values}) == 1:
+        ax.boxplot(positions, np.column_stack(data_values))
+    else:
+        for pos, values in zip(positions, data_values, strict=True):
+            ax.boxplot([pos], values.reshape(-1, 1))
 
     # Set labels if provided (using UltraPlot's format method)
     if labels:
-        positions = list(range(1, len(data_values) + 1))
         ax.format(xticks=positions, xticklabels=labels)
 
     # Apply style
@@ -175,7 +263,7 @@ def plot_box(
         title=style.get("title"),
         xlabel=style.get("xlabel"),
         ylabel=style.get("ylabel"),
-        grid=style.get("grid", True),
+        grid=style.get("grid"),
         colormap=style.get("colormap"),
     )
 
@@ -235,23 +323,28 @@ def plot_violin(
     # Extract data
     if df is not None:
         if isinstance(data, str):
-            # Single column
+            # Single column; to_numpy reuses the Arrow buffer without
+            # boxing every value into a Python float like to_list did
             series = extract_column(df, data)
             assert isinstance(series, pl.Series)  # Type guard for ty
-            data_values = [series.to_list()]
+            data_values = [series.to_numpy()]
         else:
-            # Multiple columns
-            data_values = []
-            for col in data:
-                series = extract_column(df, col)
-                assert isinstance(series, pl.Series)  # Type guard for ty
-                data_values.append(series.to_list())
+            # Multiple columns in one vectorized conversion: select
+            # produces a single (n, k) array instead of k per-column
+            # Series-to-array round trips
+            try:
+                arr = df.select(data).to_numpy()
+            except pl.exceptions.ColumnNotFoundError as e:
+                available = ", ".join(df.columns)
+                msg = f"Column not found in data. Available columns: {available}"
+                raise ValueError(msg) from e
+            data_values = [arr[:, i] for i in range(arr.shape[1])]
     elif isinstance(data[0], list):
-        # Direct data - multiple datasets
-        data_values = data
+        # Direct data - multiple datasets, converted once to typed arrays
+        data_values = [np.asarray(d, dtype=np.float64) for d in data]
     else:
         # Direct data - single list
-        data_values = [data]
+        data_values = [np.asarray(data, dtype=np.float64)]
 
     # Create figure
     width = output.get("width", 15.0)
@@ -261,13 +354,36 @@ def plot_violin(
     # Create positions for violin plots
     positions = list(range(1, len(data_values) + 1))
 
-    # Plot violin plot
-    ax.violinplot(data_values, positions=positions, showmeans=True, showmedians=True)
-
-    # Apply labels if provided
+    # Plot violin plot; large samples use the linear-time binned
+    # density approximation instead of the exact per-sample KDE
+    if max(len(v) for v in data_values) >= _FAST_VIOLIN_MIN_POINTS:
+        _fast_violin(ax, data_values, positions)
+    elif len({len(v) for v in data_values}) == 1:
+        # UltraPlot's positional (x, data) convention pins the bodies
+        # at 1..k, matching the tick positions and the fast path; the
+        # positions kwarg is dropped by the input standardization.
+        # Equal-length datasets go in as one (n, k) array so the KDE
+        # setup runs vectorized over columns
+        ax.violinplot(
+            positions, np.column_stack(data_values), showmeans=True, showmedians=True
+        )
+    else:
+        # Ragged datasets are drawn one column at a time (NaN padding
+        # would corrupt the densities)
+        for pos, values in zip(positions, data_values, strict=True):
+            ax.violinplot(
+                [pos], values.reshape(-1, 1), showmeans=True, showmedians=True
+            )
+
+    # Apply labels if provided. FixedLocator/FixedFormatter install the
+    # tick positions and label strings directly; set_xticklabels would
+    # instead eagerly build and measure a Text artist per label, work
+    # the draw pass then repeats.
     if labels:
-        ax.set_xticks(positions)
-        ax.set_xticklabels(labels)
+        from matplotlib.ticker import FixedFormatter, FixedLocator  # noqa: PLC0415
+
+        ax.xaxis.set_major_locator(FixedLocator(positions))
+        ax.xaxis.set_major_formatter(FixedFormatter(labels))
 
     # Apply style
     apply_style(
@@ -275,7 +391,7 @@ def plot_violin(
         title=style.get("title"),
         xlabel=style.get("xlabel"),
         ylabel=style.get("ylabel"),
-        grid=style.get("grid", True),
+        grid=style.get("grid"),
         colormap=style.get("colormap"),
     )
 
@@ -1,15 +1,16 @@
 """Common type definitions for ML Research MCP plotting tools.
 
-This module defines Pydantic models for plot configuration and data input.
-These types ensure type safety and automatic validation across all plotting tools.
+This module defines lightweight dataclasses for plot configuration and
+data input. They validate their fields on construction without the
+per-instance overhead of Pydantic model machinery.
 """
 
+from dataclasses import dataclass
 from typing import Literal
 
-from pydantic import BaseModel, Field
 
-
-class PlotOutputConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class PlotOutputConfig:
     """Configuration for plot output format and dimensions.
 
     Attributes:
@@ -19,28 +20,29 @@ class PlotOutputConfig(BaseModel):
         dpi: Resolution for raster formats (only affects PNG)
     """
 
-    format: Literal["png", "pdf", "svg"] = Field(
-        default="png",
-        description="Output format: png (raster), pdf/svg (vector)",
-    )
-    width: float = Field(
-        default=15.0,
-        description="Figure width in cm",
-        gt=0,
-    )
-    height: float = Field(
-        default=10.0,
-        description="Figure height in cm",
-        gt=0,
-    )
-    dpi: int = Field(
-        default=300,
-        description="DPI for raster formats (PNG only)",
-        gt=0,
-    )
-
-
-class PlotStyleConfig(BaseModel):
+    format: Literal["png", "pdf", "svg"] = "png"
+    width: float = 15.0
+    height: float = 10.0
+    dpi: int = 300
+
+    def __post_init__(self) -> None:
+        """Validate field values after construction."""
+        if self.format not in ("png", "pdf", "svg"):
+            msg = f"Unsupported format: {self.format}. Supported formats: png, pdf, svg"
+            raise ValueError(msg)
+        if self.width <= 0 or self.height <= 0:
+            msg = (
+                f"Figure dimensions must be positive, "
+                f"got width={self.width}, height={self.height}"
+            )
+            raise ValueError(msg)
+        if self.dpi <= 0:
+            msg = f"DPI must be positive, got {self.dpi}"
+            raise ValueError(msg)
+
+
+@dataclass(slots=True, frozen=True)
+class PlotStyleConfig:
     """Configuration for plot styling and appearance.
 
     Attributes:
@@ -52,35 +54,22 @@ class PlotStyleConfig(BaseModel):
         alpha: Transparency level (0.0 to 1.0)
     """
 
-    colormap: str | None = Field(
-        default=None,
-        description="Colormap name for data visualization",
-    )
-    title: str | None = Field(
-        default=None,
-        description="Plot title",
-    )
-    xlabel: str | None = Field(
-        default=None,
-        description="X-axis label",
-    )
-    ylabel: str | None = Field(
-        default=None,
-        description="Y-axis label",
-    )
-    grid: bool = Field(
-        default=True,
-        description="Show grid lines",
-    )
-    alpha: float | None = Field(
-        default=None,
-        description="Transparency level (0.0 to 1.0)",
-        ge=0.0,
-        le=1.0,
-    )
-
-
-class DataInput(BaseModel):
+    colormap: str | None = None
+    title: str | None = None
+    xlabel: str | None = None
+    ylabel: str | None = None
+    grid: bool = True
+    alpha: float | None = None
+
+    def __post_init__(self) -> None:
+        """Validate field values after construction."""
+        if self.alpha is not None and not 0.0 <= self.alpha <= 1.0:
+            msg = f"Alpha must be between 0.0 and 1.0, got {self.alpha}"
+            raise ValueError(msg)
+
+
+@dataclass(slots=True, frozen=True)
+class DataInput:
     """Configuration for data input source.
 
     Either file_path or data must be provided, but not both.
@@ -97,11 +86,20 @@ class DataInput(BaseModel):
         >>> DataInput(data={"x": [1, 2, 3], "y": [4, 5, 6]})
     """
 
-    file_path: str | None = Field(
-        default=None,
-        description="Path to data file (CSV, JSON, etc.)",
-    )
-    data: dict | None = Field(
-        default=None,
-        description="Direct data input as JSON/dict",
-    )
+    file_path: str | None = None
+    data: dict | None = None
+
+    def __post_init__(self) -> None:
+        """Validate that exactly one input source is provided."""
+        if self.file_path and self.data:
+            msg = (
+                "Provide either file_path or data, not both. "
+                "Use file_path for loading from files, or data for direct input."
+            )
+            raise ValueError(msg)
+        if not self.file_path and not self.data:
+            msg = (
+                "Must provide either file_path or data. "
+                "Please specify a file to load or provide data directly."
+            )
+            raise ValueError(msg)
@@ -1,10 +1,26 @@
 """Pytest configuration and fixtures for ML Research MCP tests."""
 
+import os
+import tempfile
 from pathlib import Path
 
 import polars as pl
 import pytest
 
+# Under pytest-xdist, point each worker at its own matplotlib config
+# directory before matplotlib is first imported, so workers don't
+# contend on the shared font-cache lock in ~/.matplotlib. The
+# directories are keyed by worker id (gw0, gw1, ...) rather than pid
+# so the font cache persists across runs. Serial runs keep the default
+# config dir. Forcing the Agg backend keeps any stray import path from
+# probing GUI toolkits.
+_xdist_worker = os.environ.get("PYTEST_XDIST_WORKER")
+if _xdist_worker:
+    _mpl_dir = Path(tempfile.gettempdir()) / f"mpl-{_xdist_worker}"
+    _mpl_dir.mkdir(exist_ok=True)
+    os.environ.setdefault("MPLCONFIGDIR", str(_mpl_dir))
+os.environ.setdefault("MPLBACKEND", "Agg")
+
 
 @pytest.fixture
 def test_data_dir() -> Path:
@@ -5,7 +5,7 @@ from pathlib import Path
 import polars as pl
 import pytest
 
-from ml_research_mcp.data.loaders import extract_column, load_data
+from ml_research_mcp.data.loaders import extract_column, load_and_extract, load_data
 
 
 def test_load_data_from_csv(sample_csv_path: Path) -> None:
@@ -28,6 +28,48 @@ def test_load_data_from_json(sample_json_path: Path) -> None:
     assert "y" in df.columns
 
 
+def test_load_data_from_ndjson(tmp_path: Path) -> None:
+    """Test loading newline-delimited JSON (sniffed from .json suffix)."""
+    ndjson_file = tmp_path / "records.json"
+    ndjson_file.write_text('{"x": 1, "y": 2}\n{"x": 3, "y": 4}\n{"x": 5, "y": 6}\n')
+
+    df = load_data(file_path=str(ndjson_file))
+    assert isinstance(df, pl.DataFrame)
+    assert df.shape == (3, 2)
+    assert df["x"].to_list() == [1, 3, 5]
+
+
+def test_load_data_from_parquet(tmp_path: Path) -> None:
+    """Test loading data from Parquet file."""
+    parquet_file = tmp_path / "data.parquet"
+    pl.DataFrame({"x": [1, 2, 3], "y": [4, 5, 6]}).write_parquet(parquet_file)
+
+    df = load_data(file_path=str(parquet_file))
+    assert isinstance(df, pl.DataFrame)
+    assert df.shape == (3, 2)
+    assert df["y"].to_list() == [4, 5, 6]
+
+
+def test_load_data_from_parquet_with_columns(tmp_path: Path) -> None:
+    """Test Parquet loading with column projection."""
+    parquet_file = tmp_path / "data.parquet"
+    pl.DataFrame({"x": [1, 2], "y": [3, 4], "z": [5, 6]}).write_parquet(parquet_file)
+
+    df = load_data(file_path=str(parquet_file), columns=["x", "z"])
+    assert df.columns == ["x", "z"]
+
+
+def test_load_data_from_feather(tmp_path: Path) -> None:
+    """Test loading data from an Arrow IPC (Feather) file."""
+    feather_file = tmp_path / "data.feather"
+    pl.DataFrame({"x": [1, 2, 3], "y": [4, 5, 6]}).write_ipc(feather_file)
+
+    df = load_data(file_path=str(feather_file))
+    assert isinstance(df, pl.DataFrame)
+    assert df.shape == (3, 2)
+    assert df["x"].to_list() == [1, 2, 3]
+
+
 def test_load_data_from_direct_data(sample_direct_data: dict) -> None:
     """Test loading data from direct dictionary input."""
     df = load_data(data=sample_direct_data)
@@ -63,6 +105,19 @@ def test_load_data_unsupported_format(tmp_path: Path) -> None:
         load_data(file_path=str(unsupported_file))
 
 
+def test_load_and_extract_from_csv(sample_csv_path: Path) -> None:
+    """Test combined loading and column extraction as numpy arrays."""
+    arrays = load_and_extract(file_path=str(sample_csv_path), columns=["x", "y"])
+    assert set(arrays) == {"x", "y"}
+    assert arrays["x"].tolist() == [1, 2, 3, 4, 5]
+
+
+def test_load_and_extract_duplicate_column(sample_csv_path: Path) -> None:
+    """Test that requesting the same column twice works."""
+    arrays = load_and_extract(file_path=str(sample_csv_path), columns=["x", "x"])
+    assert list(arrays) == ["x"]
+
+
 def test_extract_column_by_name(sample_dataframe: pl.DataFrame) -> None:
     """Test extracting column by name from DataFrame."""
     series = extract_column(sample_dataframe, "x")
@@ -0,0 +1,47 @@
+"""Tests for series downsampling."""
+
+import numpy as np
+
+from ml_research_mcp.plotting.downsample import lttb_downsample
+
+
+def test_lttb_reduces_to_requested_size() -> None:
+    """Test that downsampling returns exactly n_out points."""
+    x = np.arange(10_000, dtype=np.float64)
+    y = np.sin(x / 100.0)
+
+    xs, ys = lttb_downsample(x, y, 500)
+    assert len(xs) == 500
+    assert len(ys) == 500
+
+
+def test_lttb_keeps_endpoints() -> None:
+    """Test that the first and last points are always preserved."""
+    x = np.arange(1000, dtype=np.float64)
+    y = x**2
+
+    xs, ys = lttb_downsample(x, y, 100)
+    assert xs[0] == x[0]
+    assert xs[-1] == x[-1]
+    assert ys[0] == y[0]
+    assert ys[-1] == y[-1]
+
+
+def test_lttb_keeps_extremes() -> None:
+    """Test that an isolated spike survives downsampling."""
+    x = np.arange(10_000, dtype=np.float64)
+    y = np.zeros_like(x)
+    y[4321] = 100.0
+
+    _, ys = lttb_downsample(x, y, 200)
+    assert ys.max() == 100.0
+
+
+def test_lttb_short_input_unchanged() -> None:
+    """Test that input shorter than n_out passes through unchanged."""
+    x = np.array([1.0, 2.0, 3.0])
+    y = np.array([4.0, 5.0, 6.0])
+
+    xs, ys = lttb_downsample(x, y, 100)
+    assert xs is x
+    assert ys is y
@@ -1,5 +1,6 @@
 """Tests for 2D plotting tools."""
 
+import pytest
 from PIL import Image
 
 from ml_research_mcp.tools.plot_2d import plot_contour, plot_heatmap, plot_pcolormesh
@@ -41,6 +42,15 @@ def test_plot_heatmap_pdf_output() -> None:
     assert result.startswith(b"%PDF")
 
 
+def test_plot_heatmap_non_square_1d_data() -> None:
+    """Test that 1D data with a non-square length raises ValueError."""
+    with pytest.raises(ValueError, match="square matrix"):
+        plot_heatmap(
+            data=[1.0, 2.0, 3.0, 4.0, 5.0],
+            output={"format": "png", "dpi": 100},
+        )
+
+
 def test_plot_contour_filled() -> None:
     """Test filled contour plot."""
     x = [1, 2, 3, 4, 5]
@@ -1,5 +1,6 @@
 """Tests for statistical plotting tools."""
 
+import numpy as np
 from PIL import Image
 
 from ml_research_mcp.tools.plot_statistical import plot_box, plot_histogram, plot_violin
@@ -99,6 +100,17 @@ def test_plot_violin_multiple_datasets() -> None:
     assert isinstance(result, Image.Image)
 
 
+def test_plot_violin_large_dataset() -> None:
+    """Test violin plot with a dataset large enough for the fast path."""
+    rng = np.random.default_rng(42)
+    result = plot_violin(
+        data=rng.normal(0.0, 1.0, 20_000).tolist(),
+        output={"format": "png", "dpi": 100},
+    )
+
+    assert isinstance(result, Image.Image)
+
+
 def test_plot_violin_pdf_output() -> None:
     """Test violin plot with PDF output."""
     result = plot_violin(
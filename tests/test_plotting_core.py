@@ -29,6 +29,16 @@ def test_create_plot_figure_custom_size() -> None:
     close_all_figures()
 
 
+def test_create_plot_figure_fast() -> None:
+    """Test the plain-matplotlib fast path."""
+    fig, ax = create_plot_figure(fast=True)
+    assert not isinstance(fig, uplt.Figure)
+
+    ax.plot([1, 2, 3], [1, 4, 9])
+    result = save_plot_to_image(fig, fmt="png", dpi=100)
+    assert isinstance(result, Image.Image)
+
+
 def test_save_plot_to_image_png() -> None:
     """Test saving plot as PNG returns PIL Image."""
     fig, ax = create_plot_figure()